@@ -5,36 +5,32 @@ from django.http import HttpResponseForbidden
 from django.http.response import HttpResponseNotFound
 from django.shortcuts import get_object_or_404
 
-from multinet.api.models import Workspace, WorkspaceRole, WorkspaceRoleChoice
+from multinet.api.models import Workspace, WorkspaceRoleChoice
 
 
-def _get_workspace_and_user(*args, **kwargs):
+def _get_workspace_and_user(lookup_kwarg: str, *args, **kwargs):
     """
-    Determine the workspace and user from ambiguous arguments.
+    Get the workspace and user from the arguments passed to an API endpoint function.
 
-    Helper function to get the workspace and user from the arguments
-    passed to an API endpoint function. Since different endpoints have different
-    arguments, the permission-checking decorator must be able to handle a variety of scenarios.
-    This function pulls out the workspace name passed on the keyword arguments passed in.
+    The workspace name is read from the keyword argument named by `lookup_kwarg`, which differs
+    between endpoints on a workspace (`name`) and endpoints on its children
+    (`parent_lookup_workspace__name`).
     """
-    workspace_name = ''
-    if 'parent_lookup_workspace__name' in kwargs:
-        workspace_name = kwargs['parent_lookup_workspace__name']
-    elif 'name' in kwargs:
-        workspace_name = kwargs['name']
-
-    workspace = get_object_or_404(Workspace.objects.select_related('owner'), name=workspace_name)
+    workspace = get_object_or_404(Workspace, name=kwargs[lookup_kwarg])
     user = args[1].user
 
     return workspace, user
 
 
-def require_workspace_permission(minimum_permission: WorkspaceRoleChoice) -> Any:
+def require_workspace_permission(minimum_permission: WorkspaceRoleChoice, lookup_kwarg: str) -> Any:
     """
     Check a request for proper workspace-level permissions.
 
     This decorator works for endpoints that take action on a single workspace, or on children
-    (tables and networks) on a single workspace.
+    (tables and networks) on a single workspace. The workspace name is read from the keyword
+    argument `lookup_kwarg`, which is `name` for workspace endpoints and
+    `parent_lookup_workspace__name` for child endpoints. There's no default, as `name` is the
+    child's name on child endpoints.
     Returns Http403 if the request's user does not have appropriate permissions,
     or Http404 if the request's user has no permissions and workspace is not public.
     """
@@ -42,14 +38,15 @@ def require_workspace_permission(minimum_permission: WorkspaceRoleChoice) -> Any
     def require_permission_inner(func: Any) -> Any:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            workspace, user = _get_workspace_and_user(*args, **kwargs)
-            user_permission: WorkspaceRole = workspace.get_user_permission(user)
+            workspace, user = _get_workspace_and_user(lookup_kwarg, *args, **kwargs)
+
+            # Public reads and owners don't need the user's role to be looked up
             allow_public = workspace.public and minimum_permission == WorkspaceRoleChoice.READER
-            has_minimum_permission = (
-                user_permission is not None and user_permission.role >= minimum_permission
-            )
+            if allow_public or workspace.owner_id == user.pk:
+                return func(*args, **kwargs)
 
-            if allow_public or workspace.owner == user or has_minimum_permission:
+            user_permission = workspace.get_user_permission(user)
+            if user_permission is not None and user_permission.role >= minimum_permission:
                 return func(*args, **kwargs)
 
             if workspace.public:
@@ -65,19 +62,27 @@ def require_workspace_permission(minimum_permission: WorkspaceRoleChoice) -> Any
     return require_permission_inner
 
 
-def require_workspace_ownership(func: Any) -> Any:
-    """Check a request for workspace ownership."""
+def require_workspace_ownership(lookup_kwarg: str) -> Any:
+    """
+    Check a request for workspace ownership.
+
+    The workspace name is read from the keyword argument `lookup_kwarg`, as in
+    `require_workspace_permission`.
+    """
+
+    def require_ownership_inner(func: Any) -> Any:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            workspace, user = _get_workspace_and_user(lookup_kwarg, *args, **kwargs)
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
-        workspace, user = _get_workspace_and_user(*args, **kwargs)
+            if workspace.owner_id == user.pk:
+                return func(*args, **kwargs)
 
-        if workspace.owner == user:
-            return func(*args, **kwargs)
+            user_permission = workspace.get_user_permission(user)
+            if user_permission is None:
+                return HttpResponseNotFound()
+            return HttpResponseForbidden()
 
-        user_permission: WorkspaceRole = workspace.get_user_permission(user)
-        if user_permission is None:
-            return HttpResponseNotFound()
-        return HttpResponseForbidden()
+        return wrapper
 
-    return wrapper
+    return require_ownership_inner
@@ -9,7 +9,11 @@ from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
 
 from multinet.api.models import Network, Table, TableTypeAnnotation, Workspace
-from multinet.api.tasks.upload.csv import process_row
+from multinet.api.tasks.upload.process_single_table import (
+    derive_table_schema,
+    get_column_processors,
+    process_columns,
+)
 
 
 class Command(BaseCommand):
@@ -59,9 +63,9 @@ class Command(BaseCommand):
                 with csv_path.open('rb') as f:
                     csv_rows = list(csv.DictReader(StringIO(f.read().decode('utf-8'))))
 
-                # Process csv rows with the type annotations
-                for i, row in enumerate(csv_rows):
-                    csv_rows[i] = process_row(row, columns)
+                # Process csv rows with the type annotations, removing any ignored columns
+                schema = derive_table_schema(tuple(columns.items()))
+                process_columns(csv_rows, get_column_processors(columns), schema.ignored_cols)
 
                 # Create the table
                 new_table = Table.objects.create(
@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from arango.database import StandardDatabase
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 from django.db.models.signals import post_delete, pre_save
 from django.dispatch import receiver
 from django_extensions.db.models import TimeStampedModel
@@ -79,6 +79,10 @@ class Workspace(TimeStampedModel):
 
     def get_user_permission(self, user: User) -> Optional[WorkspaceRole]:
         """Get the WorkspaceRole for a given user on this workspace."""
+        # Anonymous users can't have a role, so there's no need to query for one
+        if user.pk is None:
+            return None
+
         return WorkspaceRole.objects.filter(workspace=self.pk, user=user.pk).first()
 
     def get_user_permission_tuple(self, user: User) -> Union[Tuple[int, str], Tuple[None, None]]:
@@ -140,8 +144,6 @@ class Workspace(TimeStampedModel):
         maintainers: Optional[List[User]] = None,
     ):
         """Replace all existing permissions on this workspace."""
-        WorkspaceRole.objects.filter(workspace=self).delete()
-
         readers = readers or []
         new_reader_roles = [
             WorkspaceRole(workspace=self, user=user, role=WorkspaceRoleChoice.READER)
@@ -160,10 +162,15 @@ class Workspace(TimeStampedModel):
             for user in maintainers
         ]
 
-        # Create all new WorkspaceRole objects in one go
-        WorkspaceRole.objects.bulk_create(
-            [*new_reader_roles, *new_writer_roles, *new_maintainer_roles]
-        )
+        # Replace the existing roles in a single transaction, so the workspace is never left
+        # without any roles, and both statements are committed together
+        with transaction.atomic():
+            WorkspaceRole.objects.filter(workspace=self).delete()
+
+            # Create all new WorkspaceRole objects in one go
+            WorkspaceRole.objects.bulk_create(
+                [*new_reader_roles, *new_writer_roles, *new_maintainer_roles]
+            )
 
     def get_arango_db(self, readonly=True) -> StandardDatabase:
         """
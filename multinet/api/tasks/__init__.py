@@ -1,5 +1,7 @@
 import celery
 from celery.utils.log import get_task_logger
+from django.db.models import F, Func, Value
+from django.utils import timezone
 
 from multinet.api.models import Task
 
@@ -28,13 +30,20 @@ class MultinetCeleryTask(celery.Task):
 
     @staticmethod
     def fail_task_with_message(task: Task, message: str):
-        task.status = Task.Status.FAILED
-        if task.error_messages is None:
-            task.error_messages = [message]
-        else:
-            task.error_messages.append(message)
-
-        task.save()
+        # Append the message in the database, so that concurrent failures can't overwrite each
+        # other's messages, and only the affected columns are written. Appending to a NULL array
+        # results in a single element array, so missing messages don't need special handling.
+        task_model = type(task)
+        task_model.objects.filter(pk=task.pk).update(
+            status=Task.Status.FAILED,
+            error_messages=Func(
+                F('error_messages'),
+                Value(str(message)),
+                function='array_append',
+                output_field=task_model._meta.get_field('error_messages'),
+            ),
+            modified=timezone.now(),
+        )
 
     @staticmethod
     def complete_task(task: Task):
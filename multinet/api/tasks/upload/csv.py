@@ -1,5 +1,5 @@
+import codecs
 import csv
-from io import StringIO
 from typing import BinaryIO, Dict, Tuple
 
 from celery import shared_task
@@ -28,8 +28,11 @@ def process_csv(
     # Download data from S3/MinIO
     with upload.blob as blob_file:
         blob_file: BinaryIO = blob_file
+
+        # Decode the file line by line, so rows are streamed into the table as they're parsed,
+        # rather than reading the whole file into memory first
         csv_reader = csv.DictReader(
-            StringIO(blob_file.read().decode('utf-8')),
+            codecs.iterdecode(blob_file, 'utf-8'),
             delimiter=delimiter,
             quotechar=quotechar,
         )
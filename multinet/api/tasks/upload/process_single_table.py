@@ -1,98 +1,155 @@
-from collections import Counter
-from typing import Any, Dict, Iterable, Optional
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from more_itertools import chunked
 
 from multinet.api.models import Table, TableTypeAnnotation
+from multinet.api.models.table import DOCUMENT_CHUNK_SIZE
+
+from .utils import DateColumnProcessor, processor_dict
+
+# A column key, paired with the function used to convert values in that column
+ColumnProcessor = Tuple[str, Callable[[Any], Any]]
+
+# The max number of chunks that may be waiting to be inserted into arango at once
+MAX_PENDING_INSERTS = 2
+
+
+def _normalize_edge_endpoint(value: str, node_table_name: Optional[str]) -> Optional[str]:
+    """Return an edge _from/_to value in the form `table/key`, or None if it's invalid."""
+    head, sep, tail = value.partition('/')
+
+    # Add node_table_name if not already present. If we don't have a node_table_name, it's invalid
+    if not sep:
+        return f'{node_table_name}/{value}' if node_table_name else None
+
+    # Sanity check that the value is formatted with the node table name, and that we don't have
+    # more than 1 slash
+    if (node_table_name and head != node_table_name) or '/' in tail:
+        return None
 
-from .utils import processor_dict
+    return value
 
 
 def process_row(
     row: Dict[str, Any],
-    cols: Dict[str, TableTypeAnnotation.Type],
     primary_key: Optional[str] = None,
     edge_source: Optional[str] = None,
     edge_target: Optional[str] = None,
     node_table_name: Optional[str] = None,
-) -> Dict:
-    new_row = dict(row)
-
-    # Convert _key to _key
-    if primary_key:
-        # If we don't have a primary key, skip the row
-        if not new_row.get(primary_key):
+) -> Optional[Dict]:
+    """
+    Convert the key and edge columns of a row to _key, _from and _to.
+
+    The row is modified in place and returned, as rows are freshly parsed from the upload and
+    not used elsewhere. If the row should be skipped, None is returned, and the row is left
+    untouched.
+    """
+    has_edge = bool(edge_source and edge_target)
+
+    # If we don't have a primary key, edge source or edge target, skip the row. All checks are
+    # done before the row is modified, so rejected rows cost as little as possible.
+    if primary_key and not row.get(primary_key):
+        return None
+    if has_edge:
+        if not row.get(edge_source) or not row.get(edge_target):
             return None
 
-        new_row['_key'] = str(new_row.pop(primary_key))
-
-    # Convert edge source and edge target to _from and _to
-    if edge_source and edge_target:
-        # If we don't have an edge source or edge target, skip the row
-        if not new_row.get(edge_source) or not new_row.get(edge_target):
+        _from = _normalize_edge_endpoint(str(row[edge_source]), node_table_name)
+        _to = _normalize_edge_endpoint(str(row[edge_target]), node_table_name)
+        if _from is None or _to is None:
             return None
 
-        new_row['_from'] = str(new_row.pop(edge_source))
-        new_row['_to'] = str(new_row.pop(edge_target))
-
-        # If we don't have a node_table_name, skip the row
-        if ('/' not in new_row['_from'] and not node_table_name) or (
-            '/' not in new_row['_to'] and not node_table_name
-        ):
-            return None
+    # Convert _key to _key
+    if primary_key:
+        row['_key'] = str(row.pop(primary_key))
 
-        # Add node_table_name to _from and _to if not already present
-        if '/' not in new_row['_from'] and node_table_name:
-            new_row['_from'] = f'{node_table_name}/{new_row["_from"]}'
+    # Convert edge source and edge target to _from and _to
+    if has_edge:
+        del row[edge_source]
+        del row[edge_target]
+        row['_from'] = _from
+        row['_to'] = _to
 
-        if '/' not in new_row['_to'] and node_table_name:
-            new_row['_to'] = f'{node_table_name}/{new_row["_to"]}'
+    return row
 
-        # Sanity check that the _from and _to are formatted with the node table name
-        if node_table_name and (
-            new_row['_to'].split('/')[0] != node_table_name
-            or new_row['_from'].split('/')[0] != node_table_name
-        ):
-            return None
 
-        # Sanity check that we don't have more than 1 slash in the _from and _to
-        if len(new_row['_from'].split('/')) > 2 or len(new_row['_to'].split('/')) > 2:
-            return None
+def get_column_processors(cols: Dict[str, TableTypeAnnotation.Type]) -> List[ColumnProcessor]:
+    """
+    Return the processor function of each column that has one, in column order.
 
+    Key columns have no processor, as they've already been renamed by `process_row` by the time
+    columns are processed.
+    """
+    processors = []
     for col_key, col_type in cols.items():
-        # If column type is IGNORED, skip
-        if col_type == TableTypeAnnotation.Type.IGNORED:
-            new_row.pop(col_key)
-            continue
+        if col_type == TableTypeAnnotation.Type.DATE:
+            # Date processors track the format of their column, so each column needs its own
+            processors.append((col_key, DateColumnProcessor()))
+        elif col_type in processor_dict:
+            processors.append((col_key, processor_dict[col_type]))
 
-        # Get the value of the column
-        entry = new_row.get(col_key)
+    return processors
 
-        # If null, skip
-        if entry is None:
-            continue
 
-        # Process the column value
-        process_func = processor_dict.get(col_type)
-        if process_func is not None:
+def process_columns(
+    rows: List[Dict[str, Any]],
+    processors: Sequence[ColumnProcessor],
+    ignored_cols: Sequence[str] = (),
+):
+    """
+    Convert the values of each typed column in a batch of rows, in place.
+
+    The batch is processed one column at a time, using the processors computed once for the
+    whole table by `get_column_processors`. Any columns in `ignored_cols` are removed.
+    """
+    for col_key in ignored_cols:
+        for row in rows:
+            row.pop(col_key, None)
+
+    for col_key, process_func in processors:
+        for row in rows:
+            # Get the value of the column
+            entry = row.get(col_key)
+
+            # If null, skip
+            if entry is None:
+                continue
+
+            # Process the column value
             try:
-                new_row[col_key] = process_func(entry)
-            except ValueError:
-                # If error processing row, keep as string
+                row[col_key] = process_func(entry)
+            except (TypeError, ValueError):
+                # If error processing row, keep as string. TypeError is raised by the cached
+                # processors if the entry is unhashable (e.g. a list in a JSON upload).
                 pass
 
-    return new_row
 
+@dataclass(frozen=True)
+class TableSchema:
+    primary_key: Optional[str]
+    edge_source: Optional[str]
+    edge_target: Optional[str]
+    type_annotations: Tuple[Tuple[str, TableTypeAnnotation.Type], ...]
+    ignored_cols: Tuple[str, ...]
 
-def process_single_table(
-    row_data: Iterable[Dict[str, Any]],
-    table_name: str,
-    workspace: str,
-    edge: bool,
-    column_types: Dict[str, TableTypeAnnotation.Type],
-    node_table_name: Optional[str] = None,
-):
+
+@lru_cache(maxsize=64)
+def derive_table_schema(
+    column_types: Tuple[Tuple[str, TableTypeAnnotation.Type], ...]
+) -> TableSchema:
+    """
+    Validate the column types of a table, and derive its key columns and type annotations.
+
+    Column types are passed as a tuple of (column, type) pairs, so that tables which share a
+    schema (e.g. in a multi-file upload) only derive it once.
+    """
     # Check that there are not multiple primary keys, multiple edge sources, or multiple edge
     # targets using python Counter
-    value_counts = Counter(column_types.values())
+    value_counts = Counter(col_type for _, col_type in column_types)
     if value_counts[TableTypeAnnotation.Type.PRIMARY] > 1:
         raise ValueError('Multiple primary keys found')
     if value_counts[TableTypeAnnotation.Type.SOURCE] > 1:
@@ -107,37 +164,57 @@ def process_single_table(
     ):
         raise ValueError('Edge source and edge target must be present together')
 
-    # Check if we have edge, we have both source and target
-    if edge and (
-        value_counts[TableTypeAnnotation.Type.SOURCE] == 0
-        and value_counts[TableTypeAnnotation.Type.TARGET] == 0
-    ):
-        raise ValueError('Edge source and edge target must both be present if edge is true')
-
-    # Check that if we have node_table_name, we have edge
-    if node_table_name and not edge:
-        raise ValueError('edge must be true if node_table_name is present')
-
     # Reverse the cols dict to find the primary key, source, and target (if they exist)
-    reversed_cols = {v: k for k, v in column_types.items()}
+    reversed_cols = {v: k for k, v in column_types}
     primary_key = reversed_cols.get(TableTypeAnnotation.Type.PRIMARY)
     edge_source = reversed_cols.get(TableTypeAnnotation.Type.SOURCE)
     edge_target = reversed_cols.get(TableTypeAnnotation.Type.TARGET)
 
-    # Create type annotation dict where we replace primary key with _key, and source and target
-    # with _from and _to
-    type_annotation_cols = dict(column_types)
+    # Create type annotations where we replace primary key with _key, and source and target with
+    # _from and _to, and remove any IGNORED columns, keeping the original column order
+    renamed_cols = {}
     if primary_key:
-        type_annotation_cols['_key'] = type_annotation_cols.pop(primary_key)
-
+        renamed_cols[primary_key] = '_key'
     if edge_source and edge_target:
-        type_annotation_cols['_from'] = type_annotation_cols.pop(edge_source)
-        type_annotation_cols['_to'] = type_annotation_cols.pop(edge_target)
+        renamed_cols.update({edge_source: '_from', edge_target: '_to'})
+
+    type_annotations = tuple(
+        (renamed_cols.get(k, k), v)
+        for k, v in column_types
+        if v != TableTypeAnnotation.Type.IGNORED
+    )
+    ignored_cols = tuple(k for k, v in column_types if v == TableTypeAnnotation.Type.IGNORED)
+
+    return TableSchema(
+        primary_key=primary_key,
+        edge_source=edge_source,
+        edge_target=edge_target,
+        type_annotations=type_annotations,
+        ignored_cols=ignored_cols,
+    )
 
-    # If a column is IGNORED, remove it from the type annotation dict
-    type_annotation_cols = {
-        k: v for k, v in type_annotation_cols.items() if v != TableTypeAnnotation.Type.IGNORED
-    }
+
+def process_single_table(
+    row_data: Iterable[Dict[str, Any]],
+    table_name: str,
+    workspace: str,
+    edge: bool,
+    column_types: Dict[str, TableTypeAnnotation.Type],
+    node_table_name: Optional[str] = None,
+):
+    # Column order is kept in the key, so that type annotations are created in the same order
+    schema = derive_table_schema(tuple(column_types.items()))
+    primary_key = schema.primary_key
+    edge_source = schema.edge_source
+    edge_target = schema.edge_target
+
+    # Check if we have edge, we have both source and target
+    if edge and edge_source is None and edge_target is None:
+        raise ValueError('Edge source and edge target must both be present if edge is true')
+
+    # Check that if we have node_table_name, we have edge
+    if node_table_name and not edge:
+        raise ValueError('edge must be true if node_table_name is present')
 
     # Create new table
     table: Table = Table.objects.create(
@@ -150,26 +227,48 @@ def process_single_table(
     TableTypeAnnotation.objects.bulk_create(
         [
             TableTypeAnnotation(table=table, column=col_key, type=col_type)
-            for col_key, col_type in type_annotation_cols.items()
-        ]
+            for col_key, col_type in schema.type_annotations
+        ],
+        batch_size=1000,
     )
 
-    # Process rows and upload
-    processed_rows = []
-    for row in row_data:
-        # Process rows using original column types
-        new_row = process_row(
-            row, column_types, primary_key, edge_source, edge_target, node_table_name
+    # Processors may keep per-column state (e.g. detected date formats), so they're created for
+    # each table rather than cached with the schema
+    processors = get_column_processors(column_types)
+    ignored_cols = schema.ignored_cols
+
+    # Process row keys lazily, skipping any rows that were rejected. If there are no keys to
+    # convert, rows are passed through untouched.
+    valid_rows: Iterable[Dict[str, Any]] = row_data
+    if primary_key or (edge_source and edge_target):
+        processed_rows = (
+            process_row(row, primary_key, edge_source, edge_target, node_table_name)
+            for row in row_data
         )
-        if new_row is None:
-            continue
-
-        processed_rows.append(new_row)
-
-        # Batch insert 100000 rows at a time
-        if len(processed_rows) == 100000:
-            table.put_rows(processed_rows)
-            processed_rows = []
-
-    # Insert remaining rows that didn't fit into the batch
-    table.put_rows(processed_rows)
+        valid_rows = (row for row in processed_rows if row is not None)
+
+    # Convert column values (using original column types) and insert rows in chunks as they're
+    # processed, instead of accumulating them all in memory. Chunks are inserted by a background
+    # thread, so that the next chunk is processed while the previous one is being uploaded.
+    process_values = bool(processors or ignored_cols)
+    pending: Deque[Future] = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for chunk in chunked(valid_rows, DOCUMENT_CHUNK_SIZE):
+                if process_values:
+                    process_columns(chunk, processors, ignored_cols)
+
+                # Wait for earlier inserts to finish, to bound the number of chunks held in memory
+                while len(pending) >= MAX_PENDING_INSERTS:
+                    pending.popleft().result()
+
+                pending.append(executor.submit(table.put_rows, chunk))
+
+            # Wait for the remaining inserts, raising any errors they encountered
+            while pending:
+                pending.popleft().result()
+    except Exception:
+        # Rows are read while the table is being populated, so an error (e.g. invalid encoding)
+        # may only be found after some rows are inserted. Remove the partially populated table.
+        table.delete()
+        raise
@@ -1,5 +1,5 @@
 from datetime import datetime
-import json
+from functools import lru_cache
 from typing import Optional, Union
 
 from celery.utils.log import get_task_logger
@@ -9,40 +9,33 @@ from multinet.api.models import TableTypeAnnotation
 
 logger = get_task_logger(__name__)
 
+# The max number of distinct entries memoized by each of the cached processor functions
+PROCESSOR_CACHE_SIZE = 65536
 
-def str_to_bool(entry: str) -> bool:
-    """Try to determine base format of boolean so it can be converted properly."""
-
-    def from_int(x: str) -> Optional[bool]:
-        if x == '0' or x == '1':
-            return bool(int(x))
-        return None
 
-    def from_json_bool(x: str) -> Optional[bool]:
-        if x == 'true' or x == 'false':
-            return json.loads(x)
-        return None
-
-    def from_yaml_bool(x: str) -> Optional[bool]:
-        if x == 'no' or x == 'off':
-            return False
-        if x == 'yes' or x == 'on':
-            return True
-
-        return None
+# The accepted integer, JSON and YAML representations of booleans
+_BOOL_LOOKUP = {
+    '0': False,
+    '1': True,
+    'false': False,
+    'true': True,
+    'no': False,
+    'off': False,
+    'yes': True,
+    'on': True,
+}
 
-    def cast_col_entry(x: str) -> bool:
-        casters = [from_int, from_json_bool, from_yaml_bool]
-        for caster in casters:
-            cast_row = caster(x)
-            if cast_row is not None:
-                return cast_row
 
+def str_to_bool(entry: str) -> bool:
+    """Try to determine base format of boolean so it can be converted properly."""
+    value = _BOOL_LOOKUP.get(entry)
+    if value is None:
         raise ValueError
 
-    return cast_col_entry(entry)
+    return value
 
 
+@lru_cache(maxsize=PROCESSOR_CACHE_SIZE)
 def str_to_datestr(entry: str) -> str:
     """Try to read a date as an ISO 8601 string or unix timestamp."""
     try:
@@ -54,19 +47,73 @@ def str_to_datestr(entry: str) -> str:
         return dateutilparser.parse(entry).isoformat()
 
 
+# Date formats which may be detected in a date column, and then parsed with strptime
+DETECTABLE_DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%m/%d/%Y',
+]
+
+
+def detect_date_format(entry: str, datestr: str) -> Optional[str]:
+    """Return the format which strptime can use to parse entry into the same datestr, if any."""
+    for date_format in DETECTABLE_DATE_FORMATS:
+        try:
+            if datetime.strptime(entry, date_format).isoformat() == datestr:
+                return date_format
+        except (TypeError, ValueError):
+            continue
+
+    return None
+
+
+class DateColumnProcessor:
+    """
+    Convert the entries of a single date column into ISO 8601 strings.
+
+    The format of the first entry is detected, and used to parse the following entries with
+    `datetime.strptime`, which is much faster than the generic parsing in `str_to_datestr`.
+    Entries which don't match the detected format fall back to `str_to_datestr`.
+    """
+
+    def __init__(self) -> None:
+        self.date_format: Optional[str] = None
+        self.detected = False
+
+    def __call__(self, entry: str) -> str:
+        if self.date_format is not None:
+            try:
+                return datetime.strptime(entry, self.date_format).isoformat()
+            except (TypeError, ValueError):
+                pass
+
+        datestr = str_to_datestr(entry)
+        if not self.detected:
+            self.date_format = detect_date_format(entry, datestr)
+            self.detected = True
+
+        return datestr
+
+
 def str_to_number(entry: str) -> Union[int, float]:
     """Try to read a number from a given string."""
+    # Integers never contain a decimal point or exponent, so parse those entries as floats
+    # directly, instead of waiting for int() to raise
+    if isinstance(entry, str) and ('.' in entry or 'e' in entry or 'E' in entry):
+        return float(entry)
+
     try:
         return int(entry)
     except ValueError:
         return float(entry)
 
 
-# Store mapping of enums to processor functions
+# Store mapping of enums to processor functions. Key columns (primary key, edge source and edge
+# target) have no processor, as they're converted to _key, _from and _to by `process_row`.
 processor_dict = {
-    TableTypeAnnotation.Type.PRIMARY: str,
-    TableTypeAnnotation.Type.SOURCE: str,
-    TableTypeAnnotation.Type.TARGET: str,
     TableTypeAnnotation.Type.LABEL: str,
     TableTypeAnnotation.Type.STRING: str,
     TableTypeAnnotation.Type.BOOLEAN: str_to_bool,
@@ -1,5 +1,6 @@
 import itertools
-from typing import Optional
+import os
+from typing import Iterator, List, Optional
 
 from django.contrib.auth.models import User
 from faker import Faker
@@ -7,9 +8,9 @@ import pytest
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
 
-from multinet.api.models import Network, Table, Workspace
+from multinet.api.models import Network, Table, Workspace, workspace as workspace_models
 from multinet.api.tests.utils import generate_arango_documents
-from multinet.api.utils.arango import arango_system_db
+from multinet.api.utils.arango import arango_system_db, db
 
 from .factories import (
     NetworkFactory,
@@ -20,6 +21,14 @@ from .factories import (
     UserFactory,
 )
 
+# Creating a Faker instance loads all of its providers, so a single instance is shared
+_fake = Faker()
+
+
+@pytest.fixture(scope='session')
+def fake() -> Faker:
+    return _fake
+
 
 @pytest.fixture
 def api_client() -> APIClient:
@@ -41,19 +50,46 @@ def public_workspace(workspace: Workspace, user_factory: UserFactory) -> Workspa
     return workspace
 
 
+# The number of users created for the user pool
+USER_POOL_SIZE = 8
+
+
+@pytest.fixture(scope='session')
+def user_pool(django_db_setup, django_db_blocker) -> Iterator[List[User]]:
+    """
+    Return users which are created once and shared by the whole test session.
+
+    These users are created outside of any test transaction, so tests must not modify them.
+    Granting them roles on a test's workspace is fine, as those changes are rolled back.
+    """
+    with django_db_blocker.unblock():
+        # Remove any pool users left behind by an aborted session, as the test database is reused
+        User.objects.filter(username__startswith='pool_user_').delete()
+
+        # Insert all users with a single query
+        users = User.objects.bulk_create(
+            [UserFactory.build(username=f'pool_user_{i}') for i in range(USER_POOL_SIZE)]
+        )
+
+    yield users
+
+    with django_db_blocker.unblock():
+        User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+
 def populated_table(workspace: Workspace, edge: bool) -> Table:
     if not edge:
         # create a node table
-        table: Table = Table.objects.create(name=Faker().pystr(), edge=False, workspace=workspace)
+        table: Table = Table.objects.create(name=_fake.pystr(), edge=False, workspace=workspace)
         nodes = generate_arango_documents(5)
         table.put_rows(nodes)
         return table
     else:
         # create an edge table
-        table: Table = Table.objects.create(name=Faker().pystr(), edge=True, workspace=workspace)
+        table: Table = Table.objects.create(name=_fake.pystr(), edge=True, workspace=workspace)
         node_table = populated_table(workspace, False)  # recursion
-        nodes = list(node_table.get_rows())
-        edges = [{'_from': a['_id'], '_to': b['_id']} for a, b in itertools.combinations(nodes, 2)]
+        node_ids = [node['_id'] for node in node_table.get_rows()]
+        edges = [{'_from': a, '_to': b} for a, b in itertools.combinations(node_ids, 2)]
         table.put_rows(edges)
         return table
 
@@ -63,7 +99,7 @@ def populated_network(workspace: Workspace, edge_table: Optional[Table] = None)
         edge_table if edge_table is not None else populated_table(workspace, True)
     )
     node_tables = list(populated_edge_table.find_referenced_node_tables().keys())
-    network_name = Faker().pystr()
+    network_name = _fake.pystr()
     return Network.create_with_edge_definition(
         name=network_name,
         workspace=workspace,
@@ -74,7 +110,7 @@ def populated_network(workspace: Workspace, edge_table: Optional[Table] = None)
 
 def pytest_configure():
     # Register which databases exist before the function is run.
-    pytest.before_session_arango_databases = set(arango_system_db().databases())
+    pytest.before_session_arango_databases = frozenset(arango_system_db().databases())
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -82,10 +118,14 @@ def pytest_sessionfinish(session, exitstatus):
     # `pytest.mark.django_db` decorator doesn't run the model save/delete methods, meaning the sync
     # between arangodb and django doesn't happen.
 
+    # When tests are run in parallel, only clean up once all workers are finished, since databases
+    # created by other workers may still be in use.
+    if hasattr(session.config, 'workerinput'):
+        return
+
     system_db = arango_system_db(readonly=False)
-    for db in system_db.databases():
-        if db not in pytest.before_session_arango_databases:
-            system_db.delete_database(db, ignore_missing=True)
+    for db_name in set(system_db.databases()) - pytest.before_session_arango_databases:
+        system_db.delete_database(db_name, ignore_missing=True)
 
 
 register(UserFactory)
@@ -94,3 +134,63 @@ register(PublicWorkspaceFactory, _name='public_workspace')
 register(NetworkFactory)
 register(TableFactory)
 register(UploadFactory)
+
+
+@pytest.fixture(scope='session')
+def arango_db_pool() -> List[str]:
+    """
+    Return the names of arango databases which are free to be reused by a workspace.
+
+    Creating an arango database is expensive, so databases are returned to this pool once a test
+    is done with them, instead of being left for deletion at the end of the session.
+    """
+    return []
+
+
+# Each xdist worker needs its own pooled databases, as tests in other workers run concurrently
+_pooled_db_names = (
+    f'test-pool-{os.environ.get("PYTEST_XDIST_WORKER", "main")}-{i}' for i in itertools.count()
+)
+
+
+@pytest.fixture(autouse=True)
+def skip_arango_sync(request, monkeypatch):
+    """
+    Don't create or delete arango databases for workspaces, in tests marked with `no_arango`.
+
+    This is for tests which only exercise the Django side of workspaces (e.g. permissions), and
+    so never read from or write to the workspace's arango database.
+    """
+    if request.node.get_closest_marker('no_arango') is not None:
+        monkeypatch.setattr(workspace_models, 'ensure_db_created', lambda name: None)
+        monkeypatch.setattr(workspace_models, 'ensure_db_deleted', lambda name: None)
+
+
+@pytest.fixture
+def pooled_arango_db_name(request, arango_db_pool: List[str]) -> Iterator[str]:
+    """Check out the name of an empty arango database, which is created along with its workspace."""
+    name = arango_db_pool.pop() if arango_db_pool else next(_pooled_db_names)
+
+    # Remove anything left in the database by an earlier test. This is done on checkout rather
+    # than on release, so that databases left behind by an aborted session are emptied as well.
+    # The database itself may not exist, in which case it's created along with the workspace.
+    uses_arango = request.node.get_closest_marker('no_arango') is None
+    if uses_arango and arango_system_db().has_database(name):
+        database = db(name, readonly=False)
+        for graph in database.graphs():
+            database.delete_graph(graph['name'])
+        for collection in database.collections():
+            if not collection['system']:
+                database.delete_collection(collection['name'])
+
+    yield name
+
+    arango_db_pool.append(name)
+
+
+@pytest.fixture
+def workspace(
+    private_workspace_factory: PrivateWorkspaceFactory, pooled_arango_db_name: str
+) -> Workspace:
+    # Overrides the fixture registered for PrivateWorkspaceFactory, to use a pooled database
+    return private_workspace_factory(arango_db_name=pooled_arango_db_name)
@@ -1,18 +1,26 @@
 from django.core.management import call_command
 
-from multinet.api.management.commands.createarangoreadonlyuser import READONLY_USERNAME
+from multinet.api.management.commands import createarangoreadonlyuser
 from multinet.api.utils.arango import arango_system_db
 
+# The shared readonly user is used by tests running concurrently in other xdist workers, so the
+# command is tested against a separate user instead
+TEST_READONLY_USERNAME = 'readonly-test'
 
-def test_createarangoreadonlyuser():
+
+def test_createarangoreadonlyuser(monkeypatch):
+    monkeypatch.setattr(createarangoreadonlyuser, 'READONLY_USERNAME', TEST_READONLY_USERNAME)
     system_db = arango_system_db(readonly=False)
 
-    if system_db.has_user(READONLY_USERNAME):
-        system_db.delete_user(READONLY_USERNAME)
-    assert not system_db.has_user(READONLY_USERNAME)
+    if system_db.has_user(TEST_READONLY_USERNAME):
+        system_db.delete_user(TEST_READONLY_USERNAME)
+    assert not system_db.has_user(TEST_READONLY_USERNAME)
 
-    call_command('createarangoreadonlyuser')
+    try:
+        call_command('createarangoreadonlyuser')
 
-    assert system_db.has_user(READONLY_USERNAME)
-    readonly_permissions = system_db.permission(READONLY_USERNAME, '*')
-    assert readonly_permissions == 'ro'
+        assert system_db.has_user(TEST_READONLY_USERNAME)
+        readonly_permissions = system_db.permission(TEST_READONLY_USERNAME, '*')
+        assert readonly_permissions == 'ro'
+    finally:
+        system_db.delete_user(TEST_READONLY_USERNAME, ignore_missing=True)
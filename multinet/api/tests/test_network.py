@@ -12,8 +12,9 @@ from multinet.api.tests.utils import assert_limit_offset_results
 from .conftest import populated_network, populated_table
 from .fuzzy import INTEGER_ID_RE, TIMESTAMP_RE
 
+pytestmark = pytest.mark.django_db
+
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
     [
@@ -33,12 +34,12 @@ def test_network_rest_list(
     is_owner: bool,
     status_code: int,
     success: bool,
+    fake: Faker,
 ):
     if permission is not None:
         workspace.set_user_permission(user, permission)
     elif is_owner:
         workspace.set_owner(user)
-    fake = Faker()
     network_names: List[str] = [
         network_factory(name=fake.pystr(), workspace=workspace).name for _ in range(3)
     ]
@@ -57,14 +58,13 @@ def test_network_rest_list(
             assert arango_db.has_graph(network['name'])
 
 
-@pytest.mark.django_db
 def test_network_rest_list_public(
     network_factory: NetworkFactory,
     public_workspace_factory: PublicWorkspaceFactory,
     api_client: APIClient,
+    fake: Faker,
 ):
     """Test that an unauthenticated user can see networks on a public workspace."""
-    fake = Faker()
     public_workspace: Workspace = public_workspace_factory()
     network_names: List[str] = [
         network_factory(name=fake.pystr(), workspace=public_workspace).name for _ in range(3)
@@ -79,7 +79,6 @@ def test_network_rest_list_public(
         assert arango_db.has_graph(network['name'])
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
     [
@@ -143,7 +142,6 @@ def test_network_rest_create(
         assert not workspace.get_arango_db().has_graph(network_name)
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
     [
@@ -162,6 +160,7 @@ def test_network_rest_retrieve(
     is_owner: bool,
     status_code: int,
     success: bool,
+    django_assert_num_queries,
 ):
     if permission is not None:
         workspace.set_user_permission(user, permission)
@@ -169,7 +168,12 @@ def test_network_rest_retrieve(
         workspace.set_owner(user)
     network = populated_network(workspace)
 
-    r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/networks/{network.name}/')
+    # The workspace (with its owner) and the user's role are fetched to check access, and then the
+    # network is fetched along with its workspace
+    with django_assert_num_queries(3 if success else 2):
+        r = authenticated_api_client.get(
+            f'/api/workspaces/{workspace.name}/networks/{network.name}/'
+        )
     assert r.status_code == status_code
 
     if success:
@@ -193,7 +197,6 @@ def test_network_rest_retrieve(
         assert r.data == {'detail': 'Not found.'}
 
 
-@pytest.mark.django_db
 def test_network_rest_retrieve_public(public_workspace: Workspace, api_client: APIClient):
     network = populated_network(public_workspace)
     assert api_client.get(
@@ -216,7 +219,6 @@ def test_network_rest_retrieve_public(public_workspace: Workspace, api_client: A
     }
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
     [
@@ -258,7 +260,6 @@ def test_network_rest_delete(
         assert workspace.get_arango_db().has_graph(network.name)
 
 
-@pytest.mark.django_db
 def test_network_rest_delete_unauthorized(workspace: Workspace, api_client: APIClient):
     """Tests deleting a network from a workspace with an unauthorized request."""
     network = populated_network(workspace)
@@ -272,7 +273,6 @@ def test_network_rest_delete_unauthorized(workspace: Workspace, api_client: APIC
     assert workspace.get_arango_db().has_graph(network.name)
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,success',
     [
@@ -312,7 +312,6 @@ def test_network_rest_retrieve_nodes(
         assert r.status_code == 404
 
 
-@pytest.mark.django_db
 def test_network_rest_retrieve_nodes_public(public_workspace: Workspace, api_client: APIClient):
     network = populated_network(public_workspace)
     nodes = list(network.nodes())
@@ -324,7 +323,6 @@ def test_network_rest_retrieve_nodes_public(public_workspace: Workspace, api_cli
     )
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,success',
     [
@@ -364,7 +362,6 @@ def test_network_rest_retrieve_edges(
         assert r.status_code == 404
 
 
-@pytest.mark.django_db
 def test_network_rest_retrieve_edges_public(public_workspace: Workspace, api_client: APIClient):
     network = populated_network(public_workspace)
     edges = list(network.edges())
@@ -376,7 +373,6 @@ def test_network_rest_retrieve_edges_public(public_workspace: Workspace, api_cli
     )
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,success',
     [
@@ -416,7 +412,6 @@ def test_network_rest_retrieve_tables_all(
         assert response.status_code == 404
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize(
     'type,success', [('node', True), ('edge', True), ('all', True), ('foo', False)]
 )
@@ -34,13 +34,15 @@ def valid_query(workspace: Workspace, user: User, authenticated_api_client: APIC
 
 
 @pytest.fixture
-def mutating_query(workspace: Workspace, user: User, authenticated_api_client: APIClient):
+def mutating_query(
+    workspace: Workspace, user: User, authenticated_api_client: APIClient, fake: Faker
+):
     """Create a fixture for a mutating AQL query that will have an error message post processing."""
     workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
     node_table = populated_table(workspace, False)
 
     query_str = 'INSERT {name: @DOCNAME} INTO @@TABLE'
-    bind_vars = {'@TABLE': node_table.name, 'DOCNAME': Faker().pystr()}
+    bind_vars = {'@TABLE': node_table.name, 'DOCNAME': fake.pystr()}
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/queries/',
         {'query': query_str, 'bind_vars': bind_vars},
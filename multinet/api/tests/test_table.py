@@ -34,12 +34,12 @@ def test_table_rest_list(
     is_owner: bool,
     status_code: int,
     success: bool,
+    fake: Faker,
 ):
     if permission is not None:
         workspace.set_user_permission(user, permission)
     elif is_owner:
         workspace.set_owner(user)
-    fake = Faker()
     table_names: List[str] = [
         table_factory(name=fake.pystr(), workspace=workspace).name for _ in range(3)
     ]
@@ -60,10 +60,9 @@ def test_table_rest_list(
 
 @pytest.mark.django_db
 def test_table_rest_list_public(
-    table_factory: TableFactory, public_workspace: Workspace, api_client: APIClient
+    table_factory: TableFactory, public_workspace: Workspace, api_client: APIClient, fake: Faker
 ):
     """Test whether a user can see all tables on a public workspace."""
-    fake = Faker()
     table_names: List[str] = [
         table_factory(name=fake.pystr(), workspace=public_workspace).name for _ in range(3)
     ]
@@ -99,13 +98,14 @@ def test_table_rest_create(
     is_owner: bool,
     status_code: int,
     success: bool,
+    fake: Faker,
 ):
     if permission is not None:
         workspace.set_user_permission(user, permission)
     elif is_owner:
         workspace.set_owner(user)
 
-    table_name = Faker().pystr()
+    table_name = fake.pystr()
     r = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/tables/',
         {'name': table_name, 'edge': edge},
@@ -1,16 +1,15 @@
 import csv
 import pathlib
-from typing import Dict
-import uuid
+from typing import Dict, List
 
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
 import pytest
 from rest_framework.response import Response
 
-from multinet.api.models.table import TableTypeAnnotation
+from multinet.api.models.table import Table, TableTypeAnnotation
 from multinet.api.models.tasks import Upload
-from multinet.api.models.workspace import Workspace, WorkspaceRole, WorkspaceRoleChoice
+from multinet.api.models.workspace import Workspace, WorkspaceRoleChoice
 from multinet.api.tasks.upload.utils import str_to_number
 from multinet.api.tests.fuzzy import (
     INTEGER_ID_RE,
@@ -19,9 +18,15 @@ from multinet.api.tests.fuzzy import (
     s3_file_field_re,
     workspace_re,
 )
+from multinet.api.tests.utils import unique_name
+
+pytestmark = pytest.mark.django_db
 
 data_dir = pathlib.Path(__file__).parent / 'data'
 
+# The columns of airports.csv which are uploaded as numbers
+airports_number_columns = ['latitude', 'longitude', 'altitude', 'timezone', 'year built']
+
 
 def local_csv_upload(path: pathlib.Path, workspace, user) -> Upload:
     with open(path, 'rb') as f:
@@ -35,6 +40,16 @@ def local_csv_upload(path: pathlib.Path, workspace, user) -> Upload:
     )
 
 
+@pytest.fixture(scope='session')
+def airports_rows() -> List[Dict]:
+    """Return the rows of airports.csv, with number columns converted, parsed once per session."""
+    with open(data_dir / 'airports.csv') as file_stream:
+        return [
+            {**row, **{key: str_to_number(row[key]) for key in airports_number_columns}}
+            for row in csv.DictReader(file_stream)
+        ]
+
+
 @pytest.fixture
 def airports_csv(
     workspace: Workspace, user: User, authenticated_api_client, s3ff_field_value_factory
@@ -46,7 +61,7 @@ def airports_csv(
     upload = local_csv_upload(data_file, workspace, user)
 
     # Model creation request
-    table_name = f't{uuid.uuid4().hex}'
+    table_name = unique_name()
     field_value = s3ff_field_value_factory(upload.blob)
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/csv/',
@@ -66,7 +81,6 @@ def airports_csv(
         },
         format='json',
     )
-    WorkspaceRole.objects.filter(workspace=workspace, user=user).delete()
     return {
         'response': r,
         'table_name': table_name,
@@ -74,27 +88,6 @@ def airports_csv(
     }
 
 
-@pytest.mark.django_db
-def test_create_upload_model_csv(workspace: Workspace, user: User, airports_csv):
-    """Test just the response of the model creation, not the task itself."""
-    r = airports_csv['response']
-    data_file = airports_csv['data_file']
-
-    assert r.status_code == 200
-    assert r.json() == {
-        'id': INTEGER_ID_RE,
-        'workspace': workspace_re(workspace),
-        'blob': s3_file_field_re(data_file.name),
-        'user': user.username,
-        'data_type': Upload.DataType.CSV,
-        'error_messages': None,
-        'status': Upload.Status.PENDING,
-        'created': TIMESTAMP_RE,
-        'modified': TIMESTAMP_RE,
-    }
-
-
-@pytest.mark.django_db
 def test_create_upload_model_invalid_columns(
     workspace: Workspace, user: User, authenticated_api_client
 ):
@@ -118,7 +111,6 @@ def test_create_upload_model_invalid_columns(
     assert r.json() == {'columns': {'foo': ['"invalid" is not a valid choice.']}}
 
 
-@pytest.mark.django_db
 def test_create_upload_model_missing_delimiter(
     workspace: Workspace, user: User, authenticated_api_client
 ):
@@ -147,7 +139,6 @@ def test_create_upload_model_missing_delimiter(
     assert r.json() == {'delimiter': ['This field is required.']}
 
 
-@pytest.mark.django_db
 def test_create_upload_model_missing_quotechar(
     workspace: Workspace, user: User, authenticated_api_client
 ):
@@ -176,7 +167,6 @@ def test_create_upload_model_missing_quotechar(
     assert r.json() == {'quotechar': ['This field is required.']}
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize('permission,status_code', [(None, 404), (WorkspaceRoleChoice.READER, 403)])
 def test_create_upload_model_csv_invalid_permissions(
     workspace: Workspace,
@@ -195,7 +185,7 @@ def test_create_upload_model_csv_invalid_permissions(
     upload = local_csv_upload(data_file, workspace, user)
     field_value = s3ff_field_value_factory(upload.blob)
 
-    table_name = f't{uuid.uuid4().hex}'
+    table_name = unique_name()
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/csv/',
         {
@@ -215,7 +205,6 @@ def test_create_upload_model_csv_invalid_permissions(
     assert r.status_code == status_code
 
 
-@pytest.mark.django_db
 def test_create_upload_model_invalid_field_value(
     workspace: Workspace, user: User, authenticated_api_client
 ):
@@ -243,21 +232,41 @@ def test_create_upload_model_invalid_field_value(
     assert r.json() == {'field_value': ['field_value is not a valid signed string.']}
 
 
-@pytest.mark.django_db
 def test_upload_valid_csv_task_response(
-    workspace: Workspace, user: User, authenticated_api_client, airports_csv
+    workspace: Workspace,
+    user: User,
+    authenticated_api_client,
+    airports_csv,
+    airports_rows,
+    django_assert_num_queries,
 ):
-    """Test just the response of the model creation, not the task itself."""
+    """Test the response of the model creation, and the result of the task."""
     # Get upload info
-    workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
     r = airports_csv['response']
     data_file = airports_csv['data_file']
     table_name = airports_csv['table_name']
 
-    # Since we're running with celery_task_always_eager=True, this job is finished
-    r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/uploads/{r.json()["id"]}/'
-    )
+    # Check the upload model creation response
+    assert r.status_code == 200
+    assert r.json() == {
+        'id': INTEGER_ID_RE,
+        'workspace': workspace_re(workspace),
+        'blob': s3_file_field_re(data_file.name),
+        'user': user.username,
+        'data_type': Upload.DataType.CSV,
+        'error_messages': None,
+        'status': Upload.Status.PENDING,
+        'created': TIMESTAMP_RE,
+        'modified': TIMESTAMP_RE,
+    }
+
+    # Since we're running with celery_task_always_eager=True, this job is finished. After the
+    # workspace and the user's role are fetched, the upload, its workspace and its user should be
+    # fetched together.
+    with django_assert_num_queries(3):
+        r: Response = authenticated_api_client.get(
+            f'/api/workspaces/{workspace.name}/uploads/{r.json()["id"]}/'
+        )
 
     r_json = r.json()
     assert r.status_code == 200
@@ -270,38 +279,63 @@ def test_upload_valid_csv_task_response(
     )
     assert r.status_code == 200
 
-    # Check that data was ingested correctly
+    # Check that data was ingested correctly, requesting all rows so none are left unchecked
     r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/tables/{table_name}/rows/'
+        f'/api/workspaces/{workspace.name}/tables/{table_name}/rows/', {'limit': len(airports_rows)}
     )
 
     assert r.status_code == 200
     r_json = r.json()
     results = r_json['results']
 
-    # Get source data rows
-    with open(data_file) as file_stream:
-        rows = [row for row in csv.DictReader(file_stream)]
-
     # Check rows themselves
-    assert r_json['count'] == len(rows)
-    for i, row in enumerate(rows):
-        result = results[i]
+    assert r_json['count'] == len(airports_rows)
+
+    # Assert documents match
+    assert results == [dict_to_fuzzy_arango_doc(row) for row in airports_rows]
 
-        # Convert these keys so we can compare documents
-        for key in ['latitude', 'longitude', 'altitude', 'timezone', 'year built']:
-            row[key] = str_to_number(row[key])
 
-        # Assert documents match
-        assert result == dict_to_fuzzy_arango_doc(row)
+def test_upload_invalid_encoding_csv(
+    workspace: Workspace, user: User, authenticated_api_client, s3ff_field_value_factory, tmp_path
+):
+    """Test that a table is removed if its file can't be decoded partway through the upload."""
+    workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
+
+    # Rows are decoded as they're inserted, so the invalid row is only found after the table is
+    # created and the valid rows before it are read
+    data_file = tmp_path / 'invalid.csv'
+    data_file.write_bytes(b'name,value\n' + b'a,1\n' * 10 + b'\xff,2\n')
+    upload = local_csv_upload(data_file, workspace, user)
+
+    table_name = unique_name()
+    r: Response = authenticated_api_client.post(
+        f'/api/workspaces/{workspace.name}/uploads/csv/',
+        {
+            'field_value': s3ff_field_value_factory(upload.blob),
+            'edge': False,
+            'table_name': table_name,
+            'columns': {'value': 'number'},
+            'delimiter': ',',
+            'quotechar': '\"',
+        },
+        format='json',
+    )
+    assert r.status_code == 200
+
+    # Since we're running with celery_task_always_eager=True, this job has failed
+    r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/uploads/{r.json()["id"]}/')
+    assert r.json()['status'] == Upload.Status.FAILED
+    assert len(r.json()['error_messages']) == 1
+
+    # Check that the partially populated table was removed
+    assert not Table.objects.filter(workspace=workspace, name=table_name).exists()
+    assert not workspace.get_arango_db().has_collection(table_name)
 
 
-@pytest.mark.django_db
 def test_retrieve_table_type_annotations(
     workspace: Workspace, user: User, authenticated_api_client, airports_csv
 ):
     """Test that the type annotations can be retrieved successfully."""
-    workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
     table_name = airports_csv['table_name']
     r: Response = authenticated_api_client.get(
         f'/api/workspaces/{workspace.name}/tables/{table_name}/annotations/'
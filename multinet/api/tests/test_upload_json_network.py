@@ -1,9 +1,7 @@
 import io
 import json
-import operator
 import pathlib
 from typing import IO, Dict
-import uuid
 
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -16,7 +14,6 @@ from multinet.api.models import (
     Table,
     Upload,
     Workspace,
-    WorkspaceRole,
     WorkspaceRoleChoice,
 )
 from multinet.api.tests.fuzzy import (
@@ -26,8 +23,11 @@ from multinet.api.tests.fuzzy import (
     s3_file_field_re,
     workspace_re,
 )
+from multinet.api.tests.utils import assert_all_ok, unique_name
 from multinet.api.views.upload import InvalidFieldValueResponse
 
+pytestmark = pytest.mark.django_db
+
 data_dir = pathlib.Path(__file__).parent / 'data'
 miserables_json_file = data_dir / 'miserables.json'
 miserables_key_from_to_json_file = data_dir / 'miserables-key-from-to.json'
@@ -47,6 +47,34 @@ def json_file_upload(path: pathlib.Path, workspace, user) -> Upload:
         return json_upload(f, path.name, workspace, user)
 
 
+@pytest.fixture(scope='session')
+def miserables_expected_docs() -> Dict[str, Dict]:
+    """
+    Return the documents expected from uploading miserables.json, parsed once per session.
+
+    Nodes are indexed by their key, and links by their (_from, _to) pair.
+    """
+    with open(miserables_json_file) as file_stream:
+        loaded_miserables_json_file = json.load(file_stream)
+
+    return {
+        'nodes': {
+            str(node['id']): dict_to_fuzzy_arango_doc({k: v for k, v in node.items() if k != 'id'})
+            for node in loaded_miserables_json_file['nodes']
+        },
+        'links': {
+            (str(link['source']), str(link['target'])): dict_to_fuzzy_arango_doc(
+                {
+                    **{k: v for k, v in link.items() if k not in ('source', 'target')},
+                    '_from': str(link['source']),
+                    '_to': str(link['target']),
+                }
+            )
+            for link in loaded_miserables_json_file['links']
+        },
+    }
+
+
 @pytest.fixture
 def miserables_json_field_value(s3ff_field_value_factory, workspace, user) -> str:
     upload = json_file_upload(miserables_json_file, workspace, user)
@@ -62,9 +90,9 @@ def miserables_json(
 ) -> Dict:
     # Model creation request
     workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
-    network_name = f't{uuid.uuid4().hex}'
-    node_table_name = f't{uuid.uuid4().hex}_nodes'
-    edge_table_name = f't{uuid.uuid4().hex}_edges'
+    network_name = unique_name()
+    node_table_name = f'{unique_name()}_nodes'
+    edge_table_name = f'{unique_name()}_edges'
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/json_network/',
         {
@@ -81,7 +109,6 @@ def miserables_json(
         },
         format='json',
     )
-    WorkspaceRole.objects.filter(workspace=workspace, user=user).delete()
     return {
         'response': r,
         'network_name': network_name,
@@ -103,9 +130,9 @@ def miserables_json_key_from_to(
 ) -> Dict:
     # Model creation request
     workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
-    network_name = f't{uuid.uuid4().hex}'
-    node_table_name = f't{uuid.uuid4().hex}_nodes'
-    edge_table_name = f't{uuid.uuid4().hex}_edges'
+    network_name = unique_name()
+    node_table_name = f'{unique_name()}_nodes'
+    edge_table_name = f'{unique_name()}_edges'
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/json_network/',
         {
@@ -122,33 +149,12 @@ def miserables_json_key_from_to(
         },
         format='json',
     )
-    WorkspaceRole.objects.filter(workspace=workspace, user=user).delete()
     return {
         'response': r,
         'network_name': network_name,
     }
 
 
-@pytest.mark.django_db
-def test_create_upload_model(workspace: Workspace, user: User, miserables_json):
-    """Test just the response of the model creation, not the task itself."""
-    r = miserables_json['response']
-
-    assert r.status_code == 200
-    assert r.json() == {
-        'id': INTEGER_ID_RE,
-        'workspace': workspace_re(workspace),
-        'blob': s3_file_field_re(miserables_json_file.name),
-        'user': user.username,
-        'data_type': Upload.DataType.JSON_NETWORK,
-        'error_messages': None,
-        'status': Upload.Status.PENDING,
-        'created': TIMESTAMP_RE,
-        'modified': TIMESTAMP_RE,
-    }
-
-
-@pytest.mark.django_db
 def test_create_upload_model_duplicate_names(
     workspace: Workspace,
     user: User,
@@ -157,7 +163,7 @@ def test_create_upload_model_duplicate_names(
 ):
     """Test that attempting to create a network with names that are already taken, fails."""
     workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
-    network_name = f't{uuid.uuid4().hex}'
+    network_name = unique_name()
 
     def assert_response():
         r: Response = authenticated_api_client.post(
@@ -197,12 +203,11 @@ def test_create_upload_model_duplicate_names(
     assert_response()
 
 
-@pytest.mark.django_db
 def test_create_upload_model_invalid_field_value(
     workspace: Workspace, user: User, authenticated_api_client: APIClient
 ):
     workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
-    network_name = f't{uuid.uuid4().hex}'
+    network_name = unique_name()
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/json_network/',
         {
@@ -224,7 +229,6 @@ def test_create_upload_model_invalid_field_value(
     assert r.json() == InvalidFieldValueResponse.json()
 
 
-@pytest.mark.django_db
 @pytest.mark.parametrize('permission,status_code', [(None, 404), (WorkspaceRoleChoice.READER, 403)])
 def test_create_upload_model_invalid_permissions(
     workspace: Workspace,
@@ -237,7 +241,7 @@ def test_create_upload_model_invalid_permissions(
     if permission is not None:
         workspace.set_user_permission(user, permission)
 
-    network_name = f't{uuid.uuid4().hex}'
+    network_name = unique_name()
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/json_network/',
         {
@@ -249,22 +253,42 @@ def test_create_upload_model_invalid_permissions(
     assert r.status_code == status_code
 
 
-@pytest.mark.django_db
 def test_valid_d3_json_task_response(
-    workspace: Workspace, user: User, authenticated_api_client: APIClient, miserables_json
+    workspace: Workspace,
+    user: User,
+    authenticated_api_client: APIClient,
+    miserables_json,
+    miserables_expected_docs,
+    django_assert_num_queries,
 ):
-    """Test just the response of the model creation, not the task itself."""
+    """Test the response of the model creation, and the result of the task."""
     # Get upload info
-    workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
     r = miserables_json['response']
     network_name = miserables_json['network_name']
     node_table_name = f'{network_name}_nodes'
     edge_table_name = f'{network_name}_edges'
 
-    # Since we're running with celery_task_always_eager=True, this job is finished
-    r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/uploads/{r.json()["id"]}/'
-    )
+    # Check the upload model creation response
+    assert r.status_code == 200
+    assert r.json() == {
+        'id': INTEGER_ID_RE,
+        'workspace': workspace_re(workspace),
+        'blob': s3_file_field_re(miserables_json_file.name),
+        'user': user.username,
+        'data_type': Upload.DataType.JSON_NETWORK,
+        'error_messages': None,
+        'status': Upload.Status.PENDING,
+        'created': TIMESTAMP_RE,
+        'modified': TIMESTAMP_RE,
+    }
+
+    # Since we're running with celery_task_always_eager=True, this job is finished. After the
+    # workspace and the user's role are fetched, the upload, its workspace and its user should be
+    # fetched together.
+    with django_assert_num_queries(3):
+        r: Response = authenticated_api_client.get(
+            f'/api/workspaces/{workspace.name}/uploads/{r.json()["id"]}/'
+        )
 
     r_json = r.json()
     assert r.status_code == 200
@@ -272,60 +296,56 @@ def test_valid_d3_json_task_response(
     assert r_json['error_messages'] is None
 
     # Check that tables are created
-    for table_name in (node_table_name, edge_table_name):
-        r: Response = authenticated_api_client.get(
-            f'/api/workspaces/{workspace.name}/tables/{table_name}/'
-        )
-        assert r.status_code == 200
-
-    # Check that network was created
     r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/networks/{network_name}/'
+        f'/api/workspaces/{workspace.name}/tables/',
+        {'name__in': f'{node_table_name},{edge_table_name}'},
     )
     assert r.status_code == 200
+    assert {table['name'] for table in r.json()['results']} == {node_table_name, edge_table_name}
+
+    # Check that network was created, fetching it along with its workspace
+    with django_assert_num_queries(3):
+        r: Response = authenticated_api_client.get(
+            f'/api/workspaces/{workspace.name}/networks/{network_name}/'
+        )
+    assert r.status_code == 200
 
     # Get source data
-    with open(miserables_json_file) as file_stream:
-        loaded_miserables_json_file = json.load(file_stream)
-        nodes = sorted(loaded_miserables_json_file['nodes'], key=operator.itemgetter('id'))
-        links = sorted(loaded_miserables_json_file['links'], key=operator.itemgetter('source'))
+    nodes = miserables_expected_docs['nodes']
+    links = miserables_expected_docs['links']
 
-    # Check that nodes were ingested correctly
+    # Check that nodes were ingested correctly, requesting all of them in one page
     r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/networks/{network_name}/nodes/'
+        f'/api/workspaces/{workspace.name}/networks/{network_name}/nodes/', {'limit': len(nodes)}
     )
 
     r_json = r.json()
     assert r.status_code == 200
     assert r_json['count'] == len(nodes)
 
-    results = sorted(r_json['results'], key=operator.itemgetter('_key'))
-    for i, node in enumerate(nodes):
-        results[i]['group'] = int(results[i]['group'])
-        node['_key'] = str(node['id'])
-        del node['id']
-        assert results[i] == dict_to_fuzzy_arango_doc(node)
+    results = {
+        result['_key']: {**result, 'group': int(result['group'])} for result in r_json['results']
+    }
+    assert results == nodes
 
-    # Check that links were ingested correctly
+    # Check that links were ingested correctly, requesting all of them in one page
     r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/networks/{network_name}/edges/'
+        f'/api/workspaces/{workspace.name}/networks/{network_name}/edges/', {'limit': len(links)}
     )
 
     r_json = r.json()
     assert r.status_code == 200
     assert r_json['count'] == len(links)
 
-    results = sorted(r_json['results'], key=operator.itemgetter('_from'))
-    for i, link in enumerate(links):
-        results[i]['_from'] = results[i]['_from'].split('/')[1]
-        results[i]['_to'] = results[i]['_to'].split('/')[1]
-        link['_from'] = str(link['source'])
-        link['_to'] = str(link['target'])
-        del link['source'], link['target']
-        assert results[i] == dict_to_fuzzy_arango_doc(link)
+    results = {}
+    for result in r_json['results']:
+        _from = result['_from'].split('/')[1]
+        _to = result['_to'].split('/')[1]
+        results[(_from, _to)] = {**result, '_from': _from, '_to': _to}
+
+    assert results == links
 
 
-@pytest.mark.django_db
 def test_valid_d3_json_task_response_key_from_to(
     workspace: Workspace,
     user: User,
@@ -334,7 +354,6 @@ def test_valid_d3_json_task_response_key_from_to(
 ):
     """Test just the response of the model creation, not the task itself."""
     # Get upload info
-    workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
     r = miserables_json_key_from_to['response']
     network_name = miserables_json_key_from_to['network_name']
     node_table_name = f'{network_name}_nodes'
@@ -351,11 +370,13 @@ def test_valid_d3_json_task_response_key_from_to(
     assert r_json['error_messages'] is None
 
     # Check that tables are created
-    for table_name in (node_table_name, edge_table_name):
-        r: Response = authenticated_api_client.get(
+    assert_all_ok(
+        authenticated_api_client,
+        [
             f'/api/workspaces/{workspace.name}/tables/{table_name}/'
-        )
-        assert r.status_code == 200
+            for table_name in (node_table_name, edge_table_name)
+        ],
+    )
 
     # Check that network was created
     r: Response = authenticated_api_client.get(
@@ -366,44 +387,46 @@ def test_valid_d3_json_task_response_key_from_to(
     # Get source data
     with open(miserables_key_from_to_json_file) as file_stream:
         loaded_miserables_key_from_to_json_file = json.load(file_stream)
-        nodes = sorted(
-            loaded_miserables_key_from_to_json_file['nodes'], key=operator.itemgetter('_key')
-        )
-        edges = sorted(
-            loaded_miserables_key_from_to_json_file['edges'], key=operator.itemgetter('_from')
-        )
+        nodes = {node['_key']: node for node in loaded_miserables_key_from_to_json_file['nodes']}
+        edges = {
+            (edge['_from'], edge['_to']): edge
+            for edge in loaded_miserables_key_from_to_json_file['edges']
+        }
 
-    # Check that nodes were ingested correctly
+    # Check that nodes were ingested correctly, requesting all of them in one page
     r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/networks/{network_name}/nodes/'
+        f'/api/workspaces/{workspace.name}/networks/{network_name}/nodes/', {'limit': len(nodes)}
     )
 
     r_json = r.json()
     assert r.status_code == 200
     assert r_json['count'] == len(nodes)
 
-    results = sorted(r_json['results'], key=operator.itemgetter('_key'))
-    for i, node in enumerate(nodes):
-        results[i]['group'] = int(results[i]['group'])
-        assert results[i] == dict_to_fuzzy_arango_doc(node, exclude=['_key'])
+    results = {
+        result['_key']: {**result, 'group': int(result['group'])} for result in r_json['results']
+    }
+    assert results == {
+        key: dict_to_fuzzy_arango_doc(node, exclude=['_key']) for key, node in nodes.items()
+    }
 
-    # Check that links were ingested correctly
+    # Check that links were ingested correctly, requesting all of them in one page
     r: Response = authenticated_api_client.get(
-        f'/api/workspaces/{workspace.name}/networks/{network_name}/edges/'
+        f'/api/workspaces/{workspace.name}/networks/{network_name}/edges/', {'limit': len(edges)}
     )
 
     r_json = r.json()
     assert r.status_code == 200
     assert r_json['count'] == len(edges)
 
-    results = sorted(r_json['results'], key=operator.itemgetter('_from'))
-    for i, link in enumerate(edges):
-        results[i]['_from'] = results[i]['_from'].split('/')[1]
-        results[i]['_to'] = results[i]['_to'].split('/')[1]
-        assert results[i] == dict_to_fuzzy_arango_doc(link)
+    results = {}
+    for result in r_json['results']:
+        _from = result['_from'].split('/')[1]
+        _to = result['_to'].split('/')[1]
+        results[(_from, _to)] = {**result, '_from': _from, '_to': _to}
+
+    assert results == {key: dict_to_fuzzy_arango_doc(link) for key, link in edges.items()}
 
 
-@pytest.mark.django_db
 def test_d3_json_task_filter_missing(
     workspace: Workspace,
     user: User,
@@ -432,7 +455,7 @@ def test_d3_json_task_filter_missing(
     upload = json_upload(file, 'miserables', workspace, user)
     field_value = s3ff_field_value_factory(upload.blob)
 
-    network_name = f't{uuid.uuid4().hex}'
+    network_name = unique_name()
     node_table_name = f'{network_name}_nodes'
     edge_table_name = f'{network_name}_edges'
     upload_resp: Response = authenticated_api_client.post(
@@ -1,7 +1,6 @@
 import json
 import pathlib
 from typing import Dict
-import uuid
 
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -18,6 +17,7 @@ from multinet.api.tests.fuzzy import (
     s3_file_field_re,
     workspace_re,
 )
+from multinet.api.tests.utils import unique_name
 
 data_dir = pathlib.Path(__file__).parent / 'data'
 
@@ -45,7 +45,7 @@ def characters_json_table(
     upload = local_json_table_upload(data_file, workspace, user)
 
     # Model creation request
-    table_name = f't{uuid.uuid4().hex}'
+    table_name = unique_name()
     field_value = s3ff_field_value_factory(upload.blob)
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/json_table/',
@@ -130,7 +130,7 @@ def test_create_upload_model_json_table_invalid_permissions(
     upload = local_json_table_upload(data_file, workspace, user)
     field_value = s3ff_field_value_factory(upload.blob)
 
-    table_name = f't{uuid.uuid4().hex}'
+    table_name = unique_name()
     r: Response = authenticated_api_client.post(
         f'/api/workspaces/{workspace.name}/uploads/json_table/',
         {
@@ -0,0 +1,138 @@
+from datetime import datetime
+import itertools
+from typing import Optional
+
+import pytest
+
+from multinet.api.models import Table, TableTypeAnnotation, Workspace
+from multinet.api.tasks.upload import process_single_table as process_single_table_module
+from multinet.api.tasks.upload.process_single_table import (
+    _normalize_edge_endpoint,
+    get_column_processors,
+    process_columns,
+    process_single_table,
+)
+from multinet.api.tasks.upload.utils import DateColumnProcessor, str_to_datestr
+from multinet.api.tests.utils import unique_name
+
+
+@pytest.mark.parametrize(
+    'entry,date_format',
+    [
+        ('2021-03-04', '%Y-%m-%d'),
+        ('2021-03-04T05:06:07', '%Y-%m-%dT%H:%M:%S'),
+        ('2021-03-04 05:06:07.250000', '%Y-%m-%d %H:%M:%S.%f'),
+        ('03/04/2021', '%m/%d/%Y'),
+    ],
+)
+def test_date_column_processor_detects_format(entry: str, date_format: str):
+    """Test that the format of the first entry is detected, and used for the following entries."""
+    processor = DateColumnProcessor()
+    assert processor(entry) == str_to_datestr(entry)
+    assert processor.date_format == date_format
+
+    next_entry = datetime(2020, 1, 2, 3, 4, 5).strftime(date_format)
+    assert processor(next_entry) == datetime.strptime(next_entry, date_format).isoformat()
+
+
+def test_date_column_processor_fallback():
+    """Test that entries which don't match the detected format are parsed generically."""
+    processor = DateColumnProcessor()
+    assert processor('2021-03-04') == '2021-03-04T00:00:00'
+
+    assert processor('March 5, 2021') == '2021-03-05T00:00:00'
+    assert processor.date_format == '%Y-%m-%d'
+
+
+def test_date_column_processor_timestamps():
+    """Test that unix timestamps are converted, without a format being detected."""
+    processor = DateColumnProcessor()
+    assert processor('0') == datetime.fromtimestamp(0).isoformat()
+    assert processor('86400.5') == datetime.fromtimestamp(86400.5).isoformat()
+    assert processor.date_format is None
+
+
+def test_date_column_processor_undetectable_first_entry():
+    """Test that if the first entry's format can't be detected, detection isn't retried."""
+    processor = DateColumnProcessor()
+    assert processor('March 5, 2021') == '2021-03-05T00:00:00'
+    assert processor.date_format is None
+
+    assert processor('2021-03-04') == '2021-03-04T00:00:00'
+    assert processor.date_format is None
+
+
+@pytest.mark.parametrize('first_entry', [None, '2021-03-04'])
+def test_date_column_processor_unhashable(first_entry: Optional[str]):
+    """Test that unhashable JSON values are left untouched, whether or not a format is detected."""
+    rows = [{'date': first_entry}, {'date': ['2021-03-04']}, {'date': {'year': 2021}}]
+    process_columns(rows, get_column_processors({'date': TableTypeAnnotation.Type.DATE}))
+
+    assert rows[1:] == [{'date': ['2021-03-04']}, {'date': {'year': 2021}}]
+
+
+def _reference_normalize_edge_endpoint(value: str, node_table_name: Optional[str]):
+    """Normalize an edge endpoint using the checks `_normalize_edge_endpoint` replaced."""
+    if '/' not in value and not node_table_name:
+        return None
+    if '/' not in value and node_table_name:
+        value = f'{node_table_name}/{value}'
+    if node_table_name and value.split('/')[0] != node_table_name:
+        return None
+    if len(value.split('/')) > 2:
+        return None
+
+    return value
+
+
+@pytest.mark.parametrize('node_table_name', [None, '', 'a', 'ab'])
+def test_normalize_edge_endpoint(node_table_name: Optional[str]):
+    """Test edge endpoint normalization against the original checks, for all short values."""
+    values = [
+        ''.join(chars) for length in range(6) for chars in itertools.product('ab/', repeat=length)
+    ]
+    mismatches = {
+        value: _normalize_edge_endpoint(value, node_table_name)
+        for value in values
+        if _normalize_edge_endpoint(value, node_table_name)
+        != _reference_normalize_edge_endpoint(value, node_table_name)
+    }
+    assert mismatches == {}
+
+
+def test_get_column_processors_key_columns():
+    """Test that key columns, which are renamed by `process_row`, have no processors."""
+    assert (
+        get_column_processors(
+            {
+                'id': TableTypeAnnotation.Type.PRIMARY,
+                'source': TableTypeAnnotation.Type.SOURCE,
+                'target': TableTypeAnnotation.Type.TARGET,
+            }
+        )
+        == []
+    )
+
+
+@pytest.mark.django_db
+def test_process_single_table_key_columns_only(workspace: Workspace, monkeypatch):
+    """Test that a table with only key columns is inserted without processing its columns."""
+
+    def fail_process_columns(*args, **kwargs):
+        raise AssertionError('process_columns should not be called')
+
+    monkeypatch.setattr(process_single_table_module, 'process_columns', fail_process_columns)
+
+    rows = [{'id': str(i), 'name': f'node{i}'} for i in range(3)]
+    process_single_table(
+        iter([dict(row) for row in rows]),
+        unique_name(),
+        workspace,
+        False,
+        {'id': TableTypeAnnotation.Type.PRIMARY},
+    )
+
+    table = Table.objects.get(workspace=workspace)
+    assert sorted((row['_key'], row['name']) for row in table.get_rows()) == [
+        (row['id'], row['name']) for row in rows
+    ]
@@ -12,7 +12,11 @@ from multinet.api.tests.factories import (
     PublicWorkspaceFactory,
     UserFactory,
 )
-from multinet.api.tests.utils import create_users_with_permissions
+from multinet.api.tests.utils import (
+    arango_dbs,
+    assert_workspace_state,
+    create_users_with_permissions,
+)
 from multinet.api.utils.arango import arango_system_db
 
 from .conftest import populated_table
@@ -30,9 +34,9 @@ def test_workspace_rest_list(
     private_workspace_factory: PrivateWorkspaceFactory,
     user: User,
     authenticated_api_client: APIClient,
+    fake: Faker,
 ):
     """Test list endpoint for workspaces."""
-    fake = Faker()
     accessible_workspace_names: List[str] = [
         public_workspace_factory(name=fake.pystr()).name for _ in range(3)
     ]
@@ -55,13 +59,14 @@ def test_workspace_rest_list(
     r_json = r.json()
 
     # Test that we get the expected results from both django and arango
-    sysdb = arango_system_db()
+    existing_dbs = arango_dbs()
     assert r_json['count'] == len(accessible_workspace_names)
     for workspace in r_json['results']:
         assert workspace['name'] in accessible_workspace_names
-        assert sysdb.has_database(workspace['arango_db_name'])
+        assert workspace['arango_db_name'] in existing_dbs
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 def test_workspace_rest_list_no_duplicates(
     workspace: Workspace,
@@ -87,8 +92,7 @@ def test_workspace_rest_list_no_duplicates(
 
 
 @pytest.mark.django_db
-def test_workspace_rest_create(authenticated_api_client: APIClient):
-    fake = Faker()
+def test_workspace_rest_create(authenticated_api_client: APIClient, fake: Faker):
     workspace_name = fake.pystr()
 
     r = authenticated_api_client.post('/api/workspaces/', {'name': workspace_name}, format='json')
@@ -101,6 +105,7 @@ def test_workspace_rest_create(authenticated_api_client: APIClient):
     Workspace.objects.get(name=workspace_name)
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -120,6 +125,7 @@ def test_workspace_rest_rename(
     is_owner: bool,
     status_code: int,
     success: bool,
+    fake: Faker,
 ):
     if permission is not None:
         workspace.set_user_permission(user, permission)
@@ -127,7 +133,7 @@ def test_workspace_rest_rename(
         workspace.set_owner(user)
 
     old_name = workspace.name
-    new_name = Faker().pystr()
+    new_name = fake.pystr()
 
     r = authenticated_api_client.put(
         f'/api/workspaces/{workspace.name}/',
@@ -146,6 +152,7 @@ def test_workspace_rest_rename(
     assert workspace.name == expected_name
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -185,11 +192,11 @@ def test_workspace_rest_retrieve(
         }
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 def test_workspace_rest_retrieve_public(
-    public_workspace_factory: PublicWorkspaceFactory, api_client: APIClient
+    public_workspace_factory: PublicWorkspaceFactory, api_client: APIClient, fake: Faker
 ):
-    fake = Faker()
     public_workspace: Workspace = public_workspace_factory(name=fake.pystr())
     assert api_client.get(f'/api/workspaces/{public_workspace.name}/').data == {
         'id': public_workspace.pk,
@@ -229,14 +236,8 @@ def test_workspace_rest_delete(
 
     assert r.status_code == status_code
 
-    if success:
-        # Assert relevant objects are deleted
-        assert not Workspace.objects.filter(name=workspace.name).exists()
-        assert not arango_system_db().has_database(workspace.arango_db_name)
-    else:
-        # Assert objecsts are not deleted
-        assert Workspace.objects.filter(name=workspace.name).exists()
-        assert arango_system_db().has_database(workspace.arango_db_name)
+    # Assert relevant objects are deleted only if the request succeeded
+    assert_workspace_state(workspace, django_exists=not success, arango_exists=not success)
 
 
 @pytest.mark.django_db
@@ -250,10 +251,10 @@ def test_workspace_rest_delete_unauthorized(
     assert r.status_code == 401
 
     # Assert relevant objects are not deleted
-    assert Workspace.objects.filter(name=workspace.name).exists()
-    assert arango_system_db().has_database(workspace.arango_db_name)
+    assert_workspace_state(workspace, django_exists=True, arango_exists=True)
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -281,9 +282,9 @@ def test_workspace_rest_get_permissions(
     elif is_owner:
         workspace.set_owner(user)
     create_users_with_permissions(user_factory, workspace)
-    maintainer_names = [maintainer.username for maintainer in workspace.maintainers]
-    writer_names = [writer.username for writer in workspace.writers]
-    reader_names = [reader.username for reader in workspace.readers]
+    maintainer_names = {maintainer.username for maintainer in workspace.maintainers}
+    writer_names = {writer.username for writer in workspace.writers}
+    reader_names = {reader.username for reader in workspace.readers}
 
     r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/permissions/')
     assert r.status_code == status_code
@@ -293,13 +294,12 @@ def test_workspace_rest_get_permissions(
         assert r_json['public'] == workspace.public
         assert r_json['owner']['username'] == workspace.owner.username
 
-        assert all(
-            maintainer['username'] in maintainer_names for maintainer in r_json['maintainers']
-        )
-        assert all(writer['username'] in writer_names for writer in r_json['writers'])
-        assert all(reader['username'] in reader_names for reader in r_json['readers'])
+        assert {maintainer['username'] for maintainer in r_json['maintainers']} <= maintainer_names
+        assert {writer['username'] for writer in r_json['writers']} <= writer_names
+        assert {reader['username'] for reader in r_json['readers']} <= reader_names
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -314,7 +314,7 @@ def test_workspace_rest_get_permissions(
 def test_workspace_rest_put_permissions(
     workspace: Workspace,
     user: User,
-    user_factory: UserFactory,
+    user_pool: List[User],
     authenticated_api_client: APIClient,
     permission: WorkspaceRoleChoice,
     is_owner: bool,
@@ -327,10 +327,10 @@ def test_workspace_rest_put_permissions(
     elif is_owner:
         workspace.set_owner(user)
 
-    new_owner = user_factory()
-    new_maintainers: List[Dict] = [{'username': user_factory().username} for _ in range(2)]
-    new_writers: List[Dict] = [{'username': user_factory().username} for _ in range(2)]
-    new_readers: List[Dict] = [{'username': user_factory().username} for _ in range(2)]
+    new_owner = user_pool[0]
+    new_maintainers: List[Dict] = [{'username': pool_user.username} for pool_user in user_pool[1:3]]
+    new_writers: List[Dict] = [{'username': pool_user.username} for pool_user in user_pool[3:5]]
+    new_readers: List[Dict] = [{'username': pool_user.username} for pool_user in user_pool[5:7]]
     request_data = {
         'public': True,
         'owner': {'username': new_owner.username},
@@ -353,19 +353,18 @@ def test_workspace_rest_put_permissions(
         else:
             assert workspace.owner == old_owner
 
-        readers_names = [reader['username'] for reader in new_readers]
-        writers_names = [writer['username'] for writer in new_writers]
-        maintainers_names = [maintainer['username'] for maintainer in new_maintainers]
-        assert all([reader.username in readers_names for reader in workspace.readers])
-        assert all([writer.username in writers_names for writer in workspace.writers])
-        assert all(
-            [maintainer.username in maintainers_names for maintainer in workspace.maintainers]
-        )
+        readers_names = {reader['username'] for reader in new_readers}
+        writers_names = {writer['username'] for writer in new_writers}
+        maintainers_names = {maintainer['username'] for maintainer in new_maintainers}
+        assert {reader.username for reader in workspace.readers} <= readers_names
+        assert {writer.username for writer in workspace.writers} <= writers_names
+        assert {maintainer.username for maintainer in workspace.maintainers} <= maintainers_names
     else:
         assert workspace.public is False
         assert workspace.owner == old_owner
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -404,6 +403,7 @@ def test_workspace_rest_get_user_permission(
         }
 
 
+@pytest.mark.no_arango
 @pytest.mark.django_db
 def test_workspace_rest_get_user_permission_public(
     public_workspace_factory: PublicWorkspaceFactory, api_client: APIClient
@@ -468,10 +468,9 @@ def test_workspace_rest_aql(
 
 @pytest.mark.django_db
 def test_workspace_rest_aql_mutating_query(
-    workspace: Workspace, user: User, authenticated_api_client: APIClient
+    workspace: Workspace, user: User, authenticated_api_client: APIClient, fake: Faker
 ):
     workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
-    fake = Faker()
     node_table = populated_table(workspace, False)
 
     # Mutating query
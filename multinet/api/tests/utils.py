@@ -1,21 +1,54 @@
-from typing import Dict, List, Optional
+import itertools
+from typing import Dict, Iterable, List, Optional, Set
 
 from django.contrib.auth.models import User
 from rest_framework.test import APIClient
 
-from multinet.api.models import Workspace, WorkspaceRoleChoice
+from multinet.api.models import Workspace, WorkspaceRole, WorkspaceRoleChoice
 from multinet.api.tests.factories import UserFactory
+from multinet.api.utils.arango import arango_system_db
+
+# Used to generate names which are unique within a test session
+_name_counter = itertools.count()
+
+
+def unique_name(prefix: str = 't') -> str:
+    """Return a name that hasn't been returned before in this test session."""
+    return f'{prefix}{next(_name_counter)}'
 
 
 def create_users_with_permissions(user_factory: UserFactory, workspace: Workspace, num_users=3):
-    for permission in [
+    permissions = [
         WorkspaceRoleChoice.READER,
         WorkspaceRoleChoice.WRITER,
         WorkspaceRoleChoice.MAINTAINER,
-    ]:
-        user_list: List[User] = [user_factory() for _ in range(num_users)]
-        for user in user_list:
-            workspace.set_user_permission(user, permission)
+    ]
+
+    # Create all users and their roles with one query each
+    users: List[User] = User.objects.bulk_create(
+        user_factory.build_batch(num_users * len(permissions))
+    )
+    WorkspaceRole.objects.bulk_create(
+        [
+            WorkspaceRole(workspace=workspace, user=user, role=permission)
+            for i, permission in enumerate(permissions)
+            for user in users[i * num_users : (i + 1) * num_users]
+        ]
+    )
+
+
+def arango_dbs() -> Set[str]:
+    """Return the names of all arango databases, fetched with a single request."""
+    return set(arango_system_db().databases())
+
+
+def assert_workspace_state(workspace: Workspace, django_exists: bool, arango_exists: bool):
+    """Assert whether the workspace exists in Django, and whether its arango database exists."""
+    state = (
+        Workspace.objects.filter(pk=workspace.pk).exists(),
+        arango_system_db().has_database(workspace.arango_db_name),
+    )
+    assert state == (django_exists, arango_exists)
 
 
 def generate_arango_documents(n: int, num_fields: int = 3) -> List[Dict]:
@@ -23,24 +56,36 @@ def generate_arango_documents(n: int, num_fields: int = 3) -> List[Dict]:
     return [{f'foo{i}_{ii}': f'bar{i}_{ii}' for ii in range(num_fields)} for i in range(n)]
 
 
+def assert_all_ok(client: APIClient, urls: Iterable[str]):
+    """Assert that GET requests to each of the given urls succeed."""
+    statuses = {url: client.get(url).status_code for url in urls}
+    assert statuses == {url: 200 for url in statuses}
+
+
 def assert_limit_offset_results(
     client: APIClient, url: str, result: List, params: Optional[Dict] = None
 ):
     """
     Assert that a limit/offset endpoint performs correct pagination.
 
-    This is done by making the desired request with all of the relevant limit/offset permutations.
+    This is done by making the desired request with the boundary cases of limit and offset: no
+    limit, a single result, exactly all results, more than all results, a page in the middle, and
+    the last result on its own.
     """
     query_params = params or {}
-    l_range = range(len(result))
-    for limit in l_range:
-        for offset in l_range:
-            r = client.get(
-                url,
-                {**query_params, 'limit': limit, 'offset': offset},
-            )
-
-            r_json = r.json()
-            assert r.status_code == 200
-            assert r_json['count'] == limit or len(result)
-            assert r_json['results'] == result[offset : (limit + offset if limit else None)]
+    n = len(result)
+    cases = {(0, 0), (1, 0), (n, 0), (n + 1, 0), (n // 2, n // 2), (n, max(n - 1, 0))}
+    for limit, offset in sorted(cases):
+        r = client.get(
+            url,
+            {**query_params, 'limit': limit, 'offset': offset},
+        )
+
+        r_json = r.json()
+        assert r.status_code == 200
+
+        # The count is always the total number of results. A limit of 0 means no limit.
+        assert r_json['count'] == n
+        page_length = n - offset if not limit else min(limit, n - offset)
+        assert len(r_json['results']) == page_length
+        assert r_json['results'] == result[offset : offset + page_length]
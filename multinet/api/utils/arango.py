@@ -23,6 +23,8 @@ def arango_client():
     return ArangoClient(hosts=settings.MULTINET_ARANGO_URL, http_client=NoTimeoutHttpClient())
 
 
+# Each database handle holds its own HTTP session, so handles are reused to keep connections alive
+@lru_cache(maxsize=256)
 def db(name: str, readonly):
     username = 'readonly' if readonly else 'root'
     password = (
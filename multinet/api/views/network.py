@@ -87,7 +87,9 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         request_body=NetworkCreateSerializer(),
         responses={200: NetworkReturnSerializer()},
     )
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def create(self, request, parent_lookup_workspace__name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         edge_table: Table = get_object_or_404(
@@ -122,7 +124,9 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         responses={200: NetworkReturnSerializer()},
     )
     @action(detail=False, methods=['POST'])
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def from_tables(self, request, parent_lookup_workspace__name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
 
@@ -137,7 +141,9 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         network = create_csv_network(workspace, serializer)
         return Response(NetworkReturnDetailSerializer(network).data, status=status.HTTP_200_OK)
 
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def destroy(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
@@ -150,12 +156,19 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         responses={200: PaginatedResultSerializer()},
     )
     @action(detail=True, url_path='nodes')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def nodes(self, request, parent_lookup_workspace__name: str, name: str):
         # Doesn't use the Network.nodes method, in order to do proper pagination.
 
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
-        network: Network = get_object_or_404(Network, workspace=workspace, name=name)
+        # Fetch the workspace along with the network, as it's needed to access the arango graph
+        network: Network = get_object_or_404(
+            Network.objects.select_related('workspace'),
+            workspace__name=parent_lookup_workspace__name,
+            name=name,
+        )
+        workspace: Workspace = network.workspace
 
         pagination = ArangoPagination()
         query = ArangoQuery.from_collections(workspace.get_arango_db(), network.node_tables())
@@ -168,12 +181,19 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         responses={200: PaginatedResultSerializer()},
     )
     @action(detail=True, url_path='edges')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def edges(self, request, parent_lookup_workspace__name: str, name: str):
         # Doesn't use the Network.edges method, in order to do proper pagination.
 
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
-        network: Network = get_object_or_404(Network, workspace=workspace, name=name)
+        # Fetch the workspace along with the network, as it's needed to access the arango graph
+        network: Network = get_object_or_404(
+            Network.objects.select_related('workspace'),
+            workspace__name=parent_lookup_workspace__name,
+            name=name,
+        )
+        workspace: Workspace = network.workspace
 
         pagination = ArangoPagination()
         query = ArangoQuery.from_collections(workspace.get_arango_db(), network.edge_tables())
@@ -186,10 +206,15 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         responses={200: TableReturnSerializer(many=True)},
     )
     @action(detail=True, url_path='tables')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def tables(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
-        network: Network = get_object_or_404(Network, workspace=workspace, name=name)
+        network: Network = get_object_or_404(
+            Network.objects.select_related('workspace'),
+            workspace__name=parent_lookup_workspace__name,
+            name=name,
+        )
 
         serializer = NetworkTablesSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
@@ -210,7 +235,9 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
         responses={200: NetworkSessionSerializer(many=True)},
     )
     @action(detail=True, url_path='sessions')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def sessions(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
@@ -23,7 +23,9 @@ class AqlQueryViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @swagger_auto_schema(
         request_body=AqlQuerySerializer(), responses={200: AqlQueryTaskSerializer()}
     )
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def create(self, request, parent_lookup_workspace__name: str):
         """Create an AQL query task."""
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
@@ -41,7 +43,9 @@ class AqlQueryViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
 
     @swagger_auto_schema(responses={200: AqlQueryResultsSerializer()})
     @action(detail=True, url_path='results')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def results(self, request, parent_lookup_workspace__name: str, pk):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         aql_task: AqlQuery = get_object_or_404(AqlQuery, workspace=workspace, pk=pk)
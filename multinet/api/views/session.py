@@ -48,7 +48,9 @@ class SessionViewSet(
 
     @swagger_auto_schema(request_body=SessionStatePatchSerializer)
     @action(detail=True, methods=['patch'])
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def state(self, request, parent_lookup_workspace__name: str, pk=None):
         session = self.get_object()
 
@@ -70,7 +72,9 @@ class SessionViewSet(
 
     @swagger_auto_schema(request_body=SessionNamePatchSerializer)
     @action(detail=True, methods=['patch'], url_path='name')
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def set_name(self, request, parent_lookup_workspace__name: str, pk=None):
         session = self.get_object()
 
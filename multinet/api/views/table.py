@@ -50,7 +50,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     serializer_class = TableReturnSerializer
 
     filter_backends = [filters.DjangoFilterBackend]
-    filterset_fields = ['name']
+    filterset_fields = {'name': ['exact', 'in']}
 
     pagination_class = MultinetPagination
 
@@ -61,7 +61,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         request_body=TableCreateSerializer(),
         responses={200: TableReturnSerializer()},
     )
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def create(self, request, parent_lookup_workspace__name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         serializer = TableSerializer(
@@ -83,7 +85,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
 
         return Response(TableReturnSerializer(table).data, status=status.HTTP_200_OK)
 
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def destroy(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
@@ -96,7 +100,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: PaginatedResultSerializer()},
     )
     @action(detail=True, url_path='rows')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def get_rows(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
@@ -120,7 +126,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: RowInsertResponseSerializer()},
     )
     @get_rows.mapping.put
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def put_rows(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
@@ -136,7 +144,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: RowDeleteResponseSerializer()},
     )
     @get_rows.mapping.delete
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def delete_rows(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
@@ -151,7 +161,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: openapi.Schema(type=openapi.TYPE_OBJECT)},
     )
     @action(detail=True, url_path='annotations')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def get_type_annotations(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
@@ -164,7 +176,9 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: TableSessionSerializer(many=True)},
     )
     @action(detail=True, url_path='sessions')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.READER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def sessions(self, request, parent_lookup_workspace__name: str, name: str):
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
@@ -39,7 +39,7 @@ def field_value_object_key(serializer: serializers.Serializer) -> Optional[str]:
 
 
 class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
-    queryset = Upload.objects.all().select_related('workspace')
+    queryset = Upload.objects.all().select_related('workspace', 'user')
 
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = UploadReturnSerializer
@@ -54,7 +54,9 @@ class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: UploadReturnSerializer()},
     )
     @action(detail=False, url_path='csv', methods=['POST'])
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def upload_csv(self, request, parent_lookup_workspace__name: str):
         """Create an upload of a CSV file."""
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
@@ -102,7 +104,9 @@ class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: UploadReturnSerializer()},
     )
     @action(detail=False, url_path='json_table', methods=['POST'])
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def upload_json_table(self, request, parent_lookup_workspace__name: str):
         """Create an upload of a JSON table."""
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
@@ -148,7 +152,9 @@ class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         responses={200: UploadReturnSerializer()},
     )
     @action(detail=False, url_path='json_network', methods=['POST'])
-    @require_workspace_permission(WorkspaceRoleChoice.WRITER)
+    @require_workspace_permission(
+        WorkspaceRoleChoice.WRITER, lookup_kwarg='parent_lookup_workspace__name'
+    )
     def upload_json_network(self, request, parent_lookup_workspace__name: str):
         """Create an upload of a JSON network file."""
         workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
@@ -97,7 +97,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
         request_body=WorkspaceRenameSerializer(),
         responses={200: WorkspaceSerializer()},
     )
-    @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER)
+    @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER, lookup_kwarg='name')
     def update(self, request, name):
         workspace: Workspace = get_object_or_404(Workspace, name=name)
         serializer = WorkspaceRenameSerializer(data=request.data)
@@ -108,7 +108,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
 
         return Response(WorkspaceSerializer(workspace).data, status=status.HTTP_200_OK)
 
-    @require_workspace_ownership
+    @require_workspace_ownership(lookup_kwarg='name')
     def destroy(self, request, name):
         workspace: Workspace = get_object_or_404(Workspace, name=name)
         workspace.delete()
@@ -116,7 +116,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
 
     @swagger_auto_schema(responses={200: PermissionsReturnSerializer()})
     @action(detail=True, url_path='permissions')
-    @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER)
+    @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER, lookup_kwarg='name')
     def get_workspace_permissions(self, request, name: str):
         """
         Get workspace permission details for a workspace.
@@ -131,7 +131,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
 
     @swagger_auto_schema(responses={200: SingleUserWorkspacePermissionSerializer()})
     @action(detail=True, url_path='permissions/me')
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(WorkspaceRoleChoice.READER, lookup_kwarg='name')
     def get_current_user_workspace_permissions(self, request, name: str):
         """Get the workspace permission for the user of the request."""
         workspace: Workspace = get_object_or_404(Workspace, name=name)
@@ -152,7 +152,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
         request_body=PermissionsCreateSerializer(), responses={200: PermissionsReturnSerializer()}
     )
     @get_workspace_permissions.mapping.put
-    @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER)
+    @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER, lookup_kwarg='name')
     def put_workspace_permissions(self, request, name: str):
         """Update existing workspace permissions."""
         workspace: Workspace = get_object_or_404(Workspace, name=name)
@@ -180,7 +180,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
 
     @swagger_auto_schema(request_body=AqlQuerySerializer())
     @action(detail=True, methods=['POST'])
-    @require_workspace_permission(WorkspaceRoleChoice.READER)
+    @require_workspace_permission(WorkspaceRoleChoice.READER, lookup_kwarg='name')
     def aql(self, request, name: str):
         """Execute AQL in a workspace."""
         serializer = AqlQuerySerializer(data=request.data)